@@ -15,22 +15,239 @@ Date: 2024
 """
 
 import smtplib
+import socket
 import ssl
 import csv
 import pandas as pd
 import time
+import asyncio
+import atexit
+import io
 import logging
+import logging.handlers
 import os
+import queue
 import re
+import threading
+import email.generator
+import email.policy
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from email.charset import Charset
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
 from typing import List, Dict, Optional
 from datetime import datetime
+import fnmatch
 import glob
 import random
 
+try:
+    import aiosmtplib  # Optional: only needed for send_bulk_emails_async
+except ImportError:
+    aiosmtplib = None
+
+# Dot-stuffing for the raw DATA payload (RFC 5321), mirroring what
+# smtplib.sendmail does internally
+_LEADING_DOT_RE = re.compile(br'(?m)^\.')
+
+# Compiled once at import; fullmatch also rejects trailing junk that the old
+# prefix-only re.match accepted (e.g. "foo@bar.com<junk>")
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# Header-like first-column values to skip during ingest; the max length lets
+# the per-row check bail out before lowercasing anything address-sized
+_HEADER_TOKENS = frozenset({'email address', 'email'})
+_HEADER_TOKEN_MAX_LEN = max(len(token) for token in _HEADER_TOKENS)
+
+# Sentinel stamped into the cached message template wherever the recipient
+# address appears (To: header and unsubscribe footer)
+_RECIPIENT_TOKEN = "__RECIPIENT_TOKEN__"
+
+# Keep bodies as raw 8-bit UTF-8 instead of base64 so the recipient token
+# survives serialization and can be replaced in the cached bytes
+_UTF8_8BIT = Charset('utf-8')
+_UTF8_8BIT.body_encoding = None
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter shared by the send workers.
+
+    Tokens refill continuously at `rate` per second up to `capacity`, so
+    workers can burst up to the bucket size and then settle at the average
+    rate without each one sleeping a fixed delay.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0):
+        """Block until `tokens` are available, then consume them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1.0):
+        """asyncio variant of acquire(): waits without blocking the event loop."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            await asyncio.sleep(wait)
+
+
+# 1 MiB input buffer so large CSVs are pulled in with few read() syscalls
+_READ_BUFFER_SIZE = 1 << 20
+
+
+def _tune_smtp_socket(sock):
+    """
+    Disable Nagle's algorithm and enlarge the kernel send buffer.
+
+    With Nagle on, the small MAIL/RCPT/DATA command writes (especially the
+    single pipelined burst) can sit in the kernel waiting for an ACK; the
+    bigger buffer lets a whole message payload be handed off in one write.
+    """
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 18)
+    except OSError:
+        pass  # Socket tuning is best-effort; sending works without it
+
+
+def _iter_csv_files(file_pattern: str):
+    """
+    Yield file paths matching a glob-style pattern.
+
+    Uses os.scandir instead of glob.glob: directory entries carry their
+    file type, so no extra stat() call per entry, and paths are yielded as
+    they are found rather than collected into a list first.
+
+    Args:
+        file_pattern (str): Glob pattern, e.g. "data/*.csv"
+
+    Yields:
+        str: Matching file paths
+    """
+    dirpath = os.path.dirname(file_pattern)
+    pattern = os.path.basename(file_pattern)
+
+    try:
+        with os.scandir(dirpath or '.') as entries:
+            for entry in entries:
+                if entry.is_file() and fnmatch.fnmatchcase(entry.name, pattern):
+                    yield os.path.join(dirpath, entry.name) if dirpath else entry.name
+    except OSError:
+        return
+
+
+def _parse_csv(file_path: str) -> tuple:
+    """
+    Parse a single CSV file into valid and invalid email addresses.
+
+    Module-level (rather than a BulkEmailSender method) so it is picklable
+    and can run in ProcessPoolExecutor workers. Logging and stats stay with
+    the caller: in forked workers the log queue has no listener thread, so
+    read failures are returned as error strings for the parent to log.
+
+    Plain newline-delimited address lists (the common case) stream through
+    csv.reader without ever materializing a DataFrame; multi-column sheets
+    are handed to pandas, which copes better with quoting and ragged rows.
+
+    Args:
+        file_path (str): Path to the CSV file
+
+    Returns:
+        tuple: (valid_emails, invalid_emails, errors) — address lists from
+            the first column plus messages for any read failures
+    """
+    errors = []
+
+    try:
+        with open(file_path, 'r', buffering=_READ_BUFFER_SIZE, newline='', encoding='utf-8') as file:
+            multi_column = ',' in (file.readline() or '')
+
+        if multi_column:
+            try:
+                valid, invalid = _parse_csv_pandas(file_path)
+                return valid, invalid, errors
+            except Exception as e:
+                errors.append(f"Error reading CSV file {file_path} with pandas: {e}")
+                # Fall through to the streaming reader
+
+        with open(file_path, 'r', buffering=_READ_BUFFER_SIZE, newline='', encoding='utf-8') as file:
+            valid = []
+            invalid = []
+            for row in csv.reader(file):
+                if not row:
+                    continue
+                potential_email = row[0].strip()
+                if not potential_email:
+                    continue
+
+                # Skip header-like content
+                if (len(potential_email) <= _HEADER_TOKEN_MAX_LEN
+                        and potential_email.lower() in _HEADER_TOKENS):
+                    continue
+
+                if _EMAIL_RE.fullmatch(potential_email):
+                    valid.append(potential_email)
+                else:
+                    invalid.append(potential_email)
+
+            return valid, invalid, errors
+
+    except Exception as e:
+        errors.append(f"Failed to read CSV file {file_path}: {e}")
+        return [], [], errors
+
+
+def _parse_csv_pandas(file_path: str) -> tuple:
+    """
+    Parse a multi-column CSV with pandas, validating column 0 vectorized.
+
+    Only column 0 is ever used, so don't parse or allocate the rest;
+    na_filter=False keeps every cell a plain string (empty instead of NaN).
+
+    Args:
+        file_path (str): Path to the CSV file
+
+    Returns:
+        tuple: (valid_emails, invalid_emails) lists from the first column
+    """
+    df = pd.read_csv(file_path, header=None, usecols=[0], dtype={0: "string"},
+                     engine="c", na_filter=False, on_bad_lines="skip")
+
+    # Validate the first column with vectorized string operations
+    # instead of a Python-level loop over rows
+    col = df.iloc[:, 0].str.strip()
+    col = col[col != ""]
+
+    # Skip header-like content
+    col = col[~col.str.lower().isin(_HEADER_TOKENS)]
+
+    mask = col.str.fullmatch(_EMAIL_RE.pattern, na=False)
+    return col[mask].tolist(), col[~mask].tolist()
+
+
 class BulkEmailSender:
     def __init__(self):
         """Initialize the bulk email sender with default configurations."""
@@ -43,14 +260,27 @@ class BulkEmailSender:
         self.sender_name = os.getenv("SENDER_NAME", "Your Name")
         
         # Rate limiting and batch settings
-        self.delay_between_emails = 1  # Base delay between emails
         self.batch_size = 50  # Emails per batch
         self.batch_delay = 10  # Seconds to wait between batches
         self.daily_limit = 450  # Gmail's safe daily limit
+        self.concurrency = int(os.getenv("SMTP_CONCURRENCY", "5"))  # Parallel SMTP sessions (Gmail allows ~15)
+        self.emails_per_second = float(os.getenv("EMAILS_PER_SECOND", "1.0"))  # Average send rate across all workers
+        self.rate_limiter = TokenBucket(rate=self.emails_per_second,
+                                        capacity=max(self.concurrency, 1))
         
         # Retry settings
         self.max_retries = 3
         self.retry_delay_base = 5  # Base delay for exponential backoff
+        self.smtp_timeout = 30  # Socket timeout so a desynced server can't hang a worker forever
+
+        # Circuit breaker: stop sending when a batch mostly fails, instead
+        # of burning quota and retry backoff against a degraded server
+        self.abort_on_failure_ratio = 0.33
+        self.min_batch_for_abort = 30  # Don't trip the breaker on tiny batches
+
+        # One SSLContext for the process lifetime: creating it re-reads the
+        # CA bundle every time, and sharing across threads is safe in CPython
+        self._ssl_ctx = ssl.create_default_context()
         
         # Setup logging
         self.setup_logging()
@@ -65,60 +295,147 @@ class BulkEmailSender:
             'emails_sent_today': 0
         }
         
-        # SMTP connection reuse
-        self.smtp_connection = None
+        # Pool of persistent SMTP connections shared by the worker threads
+        self.smtp_pool = queue.Queue()
+        self._stats_lock = threading.Lock()
+
+        # Static content split once around the recipient slot, and the
+        # serialized message template built once up front and stamped per
+        # recipient; the send path never constructs MIME objects or
+        # re-evaluates the multi-KB body templates. Building here (not on
+        # first send) keeps pool workers from racing to build concurrently
+        self._content_template = None
+        self._payload_template = None
+        self._get_payload_template()
     
+    def _bump(self, key: str, n: int = 1):
+        """Thread-safely increment a stats counter."""
+        with self._stats_lock:
+            self.stats[key] += n
+
     def setup_logging(self):
-        """Setup logging configuration."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(f'email_log_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
-                logging.StreamHandler()
-            ]
-        )
+        """
+        Setup logging configuration.
+
+        Log records are pushed onto an in-memory queue and written to the
+        file and console by a background QueueListener thread, so send
+        workers never block on log I/O.
+        """
+        root = logging.getLogger()
+
+        if not root.handlers:  # Don't reconfigure if logging is already set up
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            file_handler = logging.FileHandler(f'email_log_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+            file_handler.setFormatter(formatter)
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(formatter)
+
+            log_queue = queue.Queue(-1)
+            root.setLevel(logging.INFO)
+            root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+            self._log_listener = logging.handlers.QueueListener(
+                log_queue, file_handler, stream_handler)
+            self._log_listener.start()
+
+            # Flush queued records (and any leftover connections) at exit
+            atexit.register(self._log_listener.stop)
+            atexit.register(self.close_smtp_pool)
+
         self.logger = logging.getLogger(__name__)
     
     def create_smtp_connection(self):
         """Create and return an authenticated SMTP connection."""
         try:
-            context = ssl.create_default_context()
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls(context=context)
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=self.smtp_timeout)
+            _tune_smtp_socket(server.sock)
+            server.starttls(context=self._ssl_ctx)
+            # starttls swaps in an SSL-wrapped socket, so tune again
+            _tune_smtp_socket(server.sock)
             server.login(self.sender_email, self.sender_password)
-            self.logger.info("SMTP connection established successfully")
+            pipelining = 'pipelining' in server.esmtp_features
+            self.logger.info("SMTP connection established successfully (PIPELINING %s)",
+                             'supported' if pipelining else 'not supported')
             return server
         except Exception as e:
-            self.logger.error(f"Failed to create SMTP connection: {str(e)}")
+            self.logger.error("Failed to create SMTP connection: %s", e)
             return None
     
-    def ensure_smtp_connection(self):
-        """Ensure we have a valid SMTP connection."""
-        if self.smtp_connection is None:
-            self.smtp_connection = self.create_smtp_connection()
-        return self.smtp_connection is not None
-    
-    def close_smtp_connection(self):
-        """Close the SMTP connection if it exists."""
-        if self.smtp_connection:
+    def open_smtp_pool(self):
+        """Fill the connection pool with one SMTP session per worker."""
+        while self.smtp_pool.qsize() < self.concurrency:
+            server = self.create_smtp_connection()
+            if server is None:
+                break
+            self.smtp_pool.put(server)
+
+        opened = self.smtp_pool.qsize()
+        if opened:
+            self.logger.info("SMTP pool ready with %d connection(s)", opened)
+        return opened > 0
+
+    def close_smtp_pool(self):
+        """Close all SMTP connections currently in the pool."""
+        while True:
             try:
-                self.smtp_connection.quit()
-                self.logger.info("SMTP connection closed")
+                server = self.smtp_pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                server.quit()
             except Exception as e:
-                self.logger.warning(f"Error closing SMTP connection: {str(e)}")
-            finally:
-                self.smtp_connection = None
+                self.logger.warning("Error closing SMTP connection: %s", e)
+        self.logger.info("SMTP pool closed")
+
+    def _checkout_connection(self):
+        """Borrow a healthy connection from the pool, creating a fresh one if needed."""
+        try:
+            server = self.smtp_pool.get(timeout=30)
+        except queue.Empty:
+            return self.create_smtp_connection()
+
+        # Cheap liveness probe: a NOOP costs one round-trip, far less than
+        # the TLS handshake + AUTH of an unconditional reconnect
+        try:
+            status, _ = server.noop()
+        except Exception:
+            status = None
+
+        if status != 250:
+            self.logger.info("Pooled SMTP connection went stale, reconnecting")
+            try:
+                server.close()
+            except Exception:
+                pass
+            server = self.create_smtp_connection()
+
+        return server
+
+    def _checkin_connection(self, server):
+        """Return a borrowed connection to the pool."""
+        if server is not None:
+            self.smtp_pool.put(server)
+
+    def _discard_connection(self, server):
+        """Drop a broken connection and replace it with a fresh one."""
+        if server is not None:
+            try:
+                server.close()
+            except Exception:
+                pass
+        replacement = self.create_smtp_connection()
+        if replacement is not None:
+            self.smtp_pool.put(replacement)
     
     def check_daily_limit(self):
         """Check if we're approaching the daily sending limit."""
         if self.stats['emails_sent_today'] >= self.daily_limit:
-            self.logger.warning(f"Daily limit of {self.daily_limit} emails reached!")
+            self.logger.warning("Daily limit of %d emails reached!", self.daily_limit)
             return False
         
         remaining = self.daily_limit - self.stats['emails_sent_today']
         if remaining <= 50:  # Warn when close to limit
-            self.logger.warning(f"Only {remaining} emails remaining in daily limit")
+            self.logger.warning("Only %d emails remaining in daily limit", remaining)
         
         return True
     
@@ -138,9 +455,8 @@ class BulkEmailSender:
         email = email.strip()
         if not email:
             return False
-            
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+
+        return _EMAIL_RE.fullmatch(email) is not None
     
     def read_emails_from_csv(self, file_path: str) -> List[str]:
         """
@@ -152,50 +468,23 @@ class BulkEmailSender:
         Returns:
             List[str]: List of valid email addresses
         """
-        emails = []
-        
-        try:
-            # Try to read with pandas first for better handling
-            df = pd.read_csv(file_path, header=None)
-            
-            # Extract emails from the first column
-            for index, row in df.iterrows():
-                if not row.empty and pd.notna(row.iloc[0]):
-                    potential_email = str(row.iloc[0]).strip()
-                    
-                    # Skip empty rows and header-like content
-                    if potential_email and potential_email.lower() not in ['email address', 'email']:
-                        if self.validate_email(potential_email):
-                            emails.append(potential_email)
-                        else:
-                            self.logger.warning(f"Invalid email format: {potential_email}")
-                            self.stats['invalid_emails'] += 1
-            
-            self.logger.info(f"Successfully read {len(emails)} valid emails from {file_path}")
-            
-        except Exception as e:
-            self.logger.error(f"Error reading CSV file {file_path}: {str(e)}")
-            
-            # Fallback to basic CSV reader
-            try:
-                with open(file_path, 'r', newline='', encoding='utf-8') as file:
-                    csv_reader = csv.reader(file)
-                    for row in csv_reader:
-                        if row and len(row) > 0:
-                            potential_email = row[0].strip()
-                            if potential_email and potential_email.lower() not in ['email address', 'email']:
-                                if self.validate_email(potential_email):
-                                    emails.append(potential_email)
-                                else:
-                                    self.logger.warning(f"Invalid email format: {potential_email}")
-                                    self.stats['invalid_emails'] += 1
-                                    
-                self.logger.info(f"Fallback: Successfully read {len(emails)} valid emails from {file_path}")
-                
-            except Exception as e2:
-                self.logger.error(f"Failed to read CSV file {file_path} with fallback method: {str(e2)}")
-        
+        emails, invalid, errors = _parse_csv(file_path)
+        self._record_parse_errors(errors)
+        self._record_invalid_emails(invalid)
+        self.logger.info("Successfully read %d valid emails from %s", len(emails), file_path)
         return emails
+
+    def _record_invalid_emails(self, invalid: List[str]):
+        """Log and count addresses that failed validation during ingest."""
+        for potential_email in invalid:
+            self.logger.warning("Invalid email format: %s", potential_email)
+        if invalid:
+            self._bump('invalid_emails', len(invalid))
+
+    def _record_parse_errors(self, errors: List[str]):
+        """Log read failures reported back by the (possibly forked) parser."""
+        for message in errors:
+            self.logger.error(message)
     
     def read_emails_from_multiple_csvs(self, file_pattern: str = "*.csv") -> List[str]:
         """
@@ -207,44 +496,79 @@ class BulkEmailSender:
         Returns:
             List[str]: List of unique valid email addresses
         """
-        all_emails = []
-        csv_files = glob.glob(file_pattern)
-        
-        if not csv_files:
-            self.logger.warning(f"No CSV files found matching pattern: {file_pattern}")
-            return []
-        
-        self.logger.info(f"Found {len(csv_files)} CSV files to process")
-        
-        for file_path in csv_files:
-            self.logger.info(f"Processing file: {file_path}")
-            emails = self.read_emails_from_csv(file_path)
-            all_emails.extend(emails)
-        
-        # Remove duplicates while preserving order
-        unique_emails = list(dict.fromkeys(all_emails))
-        
-        self.logger.info(f"Total unique emails collected: {len(unique_emails)}")
-        self.logger.info(f"Duplicate emails removed: {len(all_emails) - len(unique_emails)}")
-        
+        # Deduplicate incrementally so memory stays proportional to the
+        # unique count rather than the total row count across files
+        seen = set()
+        unique_emails = []
+        total_collected = 0
+
+        # Parse files in parallel: parsing + validation is CPU-bound, so
+        # file-level parallelism scales with core count on big CSV sets.
+        # Submitting straight off the scandir generator lets ingest start
+        # before directory discovery has finished
+        with ProcessPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+            pending = [(path, executor.submit(_parse_csv, path))
+                       for path in _iter_csv_files(file_pattern)]
+
+            if not pending:
+                self.logger.warning("No CSV files found matching pattern: %s", file_pattern)
+                return []
+
+            self.logger.info("Found %d CSV files to process", len(pending))
+
+            for file_path, future in pending:
+                emails, invalid, errors = future.result()
+                self.logger.info("Processed file: %s (%d valid emails)", file_path, len(emails))
+                self._record_parse_errors(errors)
+                self._record_invalid_emails(invalid)
+                total_collected += len(emails)
+                for email in emails:
+                    if email not in seen:
+                        seen.add(email)
+                        unique_emails.append(email)
+
+        self.logger.info("Total unique emails collected: %d", len(unique_emails))
+        self.logger.info("Duplicate emails removed: %d", total_collected - len(unique_emails))
+
         return unique_emails
     
     def create_email_content(self, recipient_email: str, custom_data: Dict = None) -> tuple:
         """
         Create email content (subject and body).
-        Customize this method to fit your program outreach needs.
-        
+
+        The static copy comes from _build_content_template, split once
+        around the recipient slot, so each call is a single string
+        concatenation rather than re-evaluating the multi-KB templates.
+
         Args:
             recipient_email (str): Recipient's email address
             custom_data (Dict): Additional data for personalization
-            
+
         Returns:
             tuple: (subject, body_text, body_html)
         """
-        
+        if self._content_template is None:
+            self._content_template = self._build_content_template()
+
+        subject, (text_prefix, text_suffix), (html_prefix, html_suffix) = self._content_template
+        return (subject,
+                text_prefix + recipient_email + text_suffix,
+                html_prefix + recipient_email + html_suffix)
+
+    def _build_content_template(self) -> tuple:
+        """
+        Build the email content templates (subject and bodies).
+        Customize this method to fit your program outreach needs; put
+        _RECIPIENT_TOKEN wherever the recipient's address should appear
+        (exactly once per body).
+
+        Returns:
+            tuple: (subject, (text_prefix, text_suffix), (html_prefix, html_suffix))
+        """
+
         # Email subject
         subject = "Career Development Program - Applications Now Open"
-        
+
         # Email body (text version)
         body_text = f"""
 Dear Student,
@@ -282,7 +606,7 @@ Application Link: [Website URL]
 Contact: [Contact Information]
 
 ---
-This email was sent to {recipient_email}. If you received this email by mistake or wish to unsubscribe, please reply with "UNSUBSCRIBE" in the subject line.
+This email was sent to {_RECIPIENT_TOKEN}. If you received this email by mistake or wish to unsubscribe, please reply with "UNSUBSCRIBE" in the subject line.
         """
         
         # Email body (HTML version)
@@ -348,95 +672,195 @@ This email was sent to {recipient_email}. If you received this email by mistake
                 
                 <hr style="margin: 30px 0; border: 1px solid #eee;">
                 <p style="font-size: 12px; color: #666;">
-                    This email was sent to {recipient_email}. If you received this email by mistake or wish to unsubscribe, 
+                    This email was sent to {_RECIPIENT_TOKEN}. If you received this email by mistake or wish to unsubscribe, 
                     please reply with "UNSUBSCRIBE" in the subject line.
                 </p>
             </div>
         </body>
         </html>
         """
-        
-        return subject, body_text, body_html
+
+        return (subject,
+                tuple(body_text.split(_RECIPIENT_TOKEN)),
+                tuple(body_html.split(_RECIPIENT_TOKEN)))
     
-    def send_email_with_retry(self, recipient_email: str, subject: str, body_text: str, body_html: str) -> bool:
+    def send_email_with_retry(self, recipient_email: str) -> bool:
         """
         Send an email with retry logic and exponential backoff.
-        
+
         Args:
             recipient_email (str): Recipient's email address
-            subject (str): Email subject
-            body_text (str): Email body (text version)
-            body_html (str): Email body (HTML version)
-            
+
         Returns:
             bool: True if email was sent successfully, False otherwise
         """
         for attempt in range(self.max_retries + 1):
+            server = self._checkout_connection()
             try:
-                return self._send_single_email(recipient_email, subject, body_text, body_html)
-            
+                result = self._send_single_email(server, recipient_email)
+                self._checkin_connection(server)
+                return result
+
             except (smtplib.SMTPServerDisconnected, smtplib.SMTPDataError, ConnectionError) as e:
-                self.logger.warning(f"Attempt {attempt + 1} failed for {recipient_email}: {str(e)}")
-                self.stats['retries'] += 1
-                
+                self.logger.warning("Attempt %d failed for %s: %s", attempt + 1, recipient_email, e)
+                self._bump('retries')
+
+                # Replace the broken connection so the pool stays full
+                self._discard_connection(server)
+
                 if attempt < self.max_retries:
                     # Exponential backoff with jitter
                     delay = self.retry_delay_base * (2 ** attempt) + random.uniform(0, 1)
-                    self.logger.info(f"Retrying in {delay:.1f} seconds...")
+                    self.logger.info("Retrying in %.1f seconds...", delay)
                     time.sleep(delay)
-                    
-                    # Reset connection on retry
-                    self.close_smtp_connection()
                 else:
-                    self.logger.error(f"All {self.max_retries + 1} attempts failed for {recipient_email}")
-                    self.stats['failed_sends'] += 1
+                    self.logger.error("All %d attempts failed for %s", self.max_retries + 1, recipient_email)
+                    self._bump('failed_sends')
                     return False
-            
+
             except Exception as e:
-                self.logger.error(f"Unexpected error sending to {recipient_email}: {str(e)}")
-                self.stats['failed_sends'] += 1
+                self.logger.error("Unexpected error sending to %s: %s", recipient_email, e)
+                # The connection's protocol state is unknown after an
+                # unexpected failure; a spare reconnect is far cheaper than
+                # poisoning the pool with a desynced session
+                self._discard_connection(server)
+                self._bump('failed_sends')
                 return False
-        
+
         return False
     
-    def _send_single_email(self, recipient_email: str, subject: str, body_text: str, body_html: str) -> bool:
+    def _get_payload_template(self) -> bytes:
         """
-        Send a single email using the reused SMTP connection.
-        
+        Build (once) and return the serialized message template.
+
+        The MIME structure, headers and multi-KB bodies are identical for
+        every recipient, so the message is constructed and serialized a
+        single time with a sentinel in place of the recipient address.
+
+        Returns:
+            bytes: Serialized message with _RECIPIENT_TOKEN placeholders
+        """
+        if self._payload_template is None:
+            subject, body_text, body_html = self.create_email_content(_RECIPIENT_TOKEN)
+
+            message = MIMEMultipart("alternative")
+            message["Subject"] = subject
+            message["From"] = f"{self.sender_name} <{self.sender_email}>"
+            message["To"] = _RECIPIENT_TOKEN
+
+            # Create text and HTML parts
+            part1 = MIMEText(body_text, "plain", _charset=_UTF8_8BIT)
+            part2 = MIMEText(body_html, "html", _charset=_UTF8_8BIT)
+
+            # Add parts to message
+            message.attach(part1)
+            message.attach(part2)
+
+            # Serialize with the SMTP policy so the template already has the
+            # CRLF line endings the wire format requires; as_bytes() would
+            # emit bare LF and force a re-encode pass on every send
+            buf = io.BytesIO()
+            email.generator.BytesGenerator(buf, policy=email.policy.SMTP).flatten(message)
+            self._payload_template = buf.getvalue()
+
+        return self._payload_template
+
+    def _send_single_email(self, server, recipient_email: str) -> bool:
+        """
+        Send a single email over a borrowed SMTP connection.
+
         Args:
+            server: Authenticated smtplib.SMTP connection from the pool
             recipient_email (str): Recipient's email address
-            subject (str): Email subject
-            body_text (str): Email body (text version)
-            body_html (str): Email body (HTML version)
-            
+
         Returns:
             bool: True if email was sent successfully, False otherwise
         """
-        # Ensure we have a valid SMTP connection
-        if not self.ensure_smtp_connection():
+        if server is None:
             raise ConnectionError("Could not establish SMTP connection")
-        
-        # Create message
-        message = MIMEMultipart("alternative")
-        message["Subject"] = subject
-        message["From"] = f"{self.sender_name} <{self.sender_email}>"
-        message["To"] = recipient_email
-        
-        # Create text and HTML parts
-        part1 = MIMEText(body_text, "plain")
-        part2 = MIMEText(body_html, "html")
-        
-        # Add parts to message
-        message.attach(part1)
-        message.attach(part2)
-        
-        # Send email using the reused connection
-        self.smtp_connection.sendmail(self.sender_email, recipient_email, message.as_string())
-        
-        self.logger.info(f"Email sent successfully to: {recipient_email}")
-        self.stats['successful_sends'] += 1
-        self.stats['emails_sent_today'] += 1
+
+        # Stamp the recipient into the cached template (To: header and footer)
+        payload = self._get_payload_template().replace(
+            _RECIPIENT_TOKEN.encode('ascii'), recipient_email.encode('ascii'))
+
+        # Send email using the borrowed connection. The template's bodies
+        # are raw 8-bit UTF-8, so declare that on MAIL FROM (RFC 6152)
+        # whenever the server advertises 8BITMIME
+        if 'pipelining' in server.esmtp_features:
+            self._sendmail_pipelined(server, recipient_email, payload)
+        else:
+            mail_options = ["BODY=8BITMIME"] if '8bitmime' in server.esmtp_features else []
+            server.sendmail(self.sender_email, recipient_email, payload,
+                            mail_options=mail_options)
+
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Email sent successfully to: %s", recipient_email)
+        with self._stats_lock:
+            self.stats['successful_sends'] += 1
+            self.stats['emails_sent_today'] += 1
         return True
+
+    def _sendmail_pipelined(self, server, recipient_email: str, message: bytes):
+        """
+        Send one message using SMTP PIPELINING (RFC 2920).
+
+        MAIL FROM, RCPT TO and DATA are written back-to-back in a single
+        socket write instead of three request/response round-trips, then the
+        three replies are read in order. Only called when the server
+        advertised PIPELINING in its EHLO response.
+
+        Args:
+            server: Authenticated smtplib.SMTP connection
+            recipient_email (str): Recipient's email address
+            message (bytes): Fully serialized RFC 822 message
+
+        Raises:
+            smtplib.SMTPSenderRefused, smtplib.SMTPRecipientsRefused,
+            smtplib.SMTPDataError: on a negative reply to the matching command
+        """
+        mail_from = f"MAIL FROM:<{self.sender_email}>"
+        if '8bitmime' in server.esmtp_features:
+            mail_from += " BODY=8BITMIME"
+
+        commands = (f"{mail_from}\r\n"
+                    f"RCPT TO:<{recipient_email}>\r\n"
+                    "DATA\r\n").encode('ascii')
+        server.sock.sendall(commands)
+
+        # Read the three replies in command order
+        mail_code, mail_resp = server.getreply()
+        rcpt_code, rcpt_resp = server.getreply()
+        data_code, data_resp = server.getreply()
+
+        mail_ok = mail_code == 250
+        rcpt_ok = rcpt_code in (250, 251)
+
+        if not (mail_ok and rcpt_ok):
+            # RFC 2920 section 3.1: the server may still answer 354 to the
+            # pipelined DATA even though it rejected MAIL or RCPT, in which
+            # case the client must send a terminating dot. Do that (and read
+            # its reply) before raising, so the connection is out of DATA
+            # state and safe to reuse
+            if data_code == 354:
+                server.send(b".\r\n")
+                server.getreply()
+            if not mail_ok:
+                raise smtplib.SMTPSenderRefused(mail_code, mail_resp, self.sender_email)
+            raise smtplib.SMTPRecipientsRefused({recipient_email: (rcpt_code, rcpt_resp)})
+
+        if data_code != 354:
+            raise smtplib.SMTPDataError(data_code, data_resp)
+
+        # Dot-stuff and terminate the DATA payload; the template is already
+        # CRLF-encoded by the SMTP-policy generator
+        payload = _LEADING_DOT_RE.sub(b"..", message)
+        if not payload.endswith(b"\r\n"):
+            payload += b"\r\n"
+        server.send(payload + b".\r\n")
+
+        end_code, end_resp = server.getreply()
+        if end_code != 250:
+            raise smtplib.SMTPDataError(end_code, end_resp)
     
     def send_bulk_emails(self, emails: List[str], test_mode: bool = True, batch_size: Optional[int] = None):
         """
@@ -460,77 +884,216 @@ This email was sent to {recipient_email}. If you received this email by mistake
             batch_size = self.batch_size
         
         self.stats['total_emails'] = len(emails)
-        self.logger.info(f"Starting bulk email send to {len(emails)} recipients")
-        self.logger.info(f"Rate limiting: {self.delay_between_emails}s between emails, {self.batch_delay}s between batches")
-        
+        self.logger.info("Starting bulk email send to %d recipients", len(emails))
+        self.logger.info("Concurrency: %d SMTP sessions, %s emails/s average, %ds between batches",
+                         self.concurrency, self.emails_per_second, self.batch_delay)
+
         try:
-            # Establish initial SMTP connection
-            if not self.ensure_smtp_connection():
-                self.logger.error("Could not establish initial SMTP connection. Aborting.")
+            # Establish the initial SMTP connection pool
+            if not self.open_smtp_pool():
+                self.logger.error("Could not establish initial SMTP connections. Aborting.")
                 return
-            
-            for i, email in enumerate(emails, 1):
-                # Check daily limit before sending
-                if not self.check_daily_limit():
-                    self.logger.error("Daily email limit reached. Stopping email send.")
-                    break
-                
-                self.logger.info(f"Sending email {i}/{len(emails)} to: {email}")
-                
-                # Create email content
-                subject, body_text, body_html = self.create_email_content(email)
-                
-                # Send email with retry logic
-                success = self.send_email_with_retry(email, subject, body_text, body_html)
-                
-                if not success:
-                    self.logger.warning(f"Failed to send email to {email} after all retries")
-                
-                # Add delay between emails (with some randomization to avoid pattern detection)
-                if i < len(emails):  # Don't delay after the last email
-                    delay = self.delay_between_emails + random.uniform(0, 0.5)
-                    time.sleep(delay)
-                
-                # Batch handling with longer pause
-                if i % batch_size == 0 and i < len(emails):
-                    self.logger.info(f"Completed batch of {batch_size} emails. Pausing for {self.batch_delay} seconds...")
-                    
-                    # Close and reconnect SMTP connection between batches to avoid timeouts
-                    self.close_smtp_connection()
-                    time.sleep(self.batch_delay)
-                    
-                    # Reconnect for next batch
-                    if not self.ensure_smtp_connection():
-                        self.logger.error("Could not reconnect SMTP. Stopping email send.")
+
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                for batch_start in range(0, len(emails), batch_size):
+                    # Check daily limit before dispatching each batch
+                    if not self.check_daily_limit():
+                        self.logger.error("Daily email limit reached. Stopping email send.")
                         break
-        
+
+                    batch = emails[batch_start:batch_start + batch_size]
+                    self.logger.info("Dispatching batch of %d emails (%d-%d/%d)", len(batch),
+                                     batch_start + 1, batch_start + len(batch), len(emails))
+
+                    futures = {executor.submit(self._send_worker, email): email for email in batch}
+
+                    batch_failures = 0
+                    for future in futures:
+                        email = futures[future]
+                        if not future.result():
+                            batch_failures += 1
+                            self.logger.warning("Failed to send email to %s after all retries", email)
+
+                    # Circuit breaker: a mostly-failing batch means the server
+                    # is rejecting us (rate limit, block, auth); pushing on
+                    # just burns quota and retry backoff
+                    if (len(batch) >= self.min_batch_for_abort
+                            and batch_failures / len(batch) >= self.abort_on_failure_ratio):
+                        self.logger.critical(
+                            "Aborting send: %d/%d emails in this batch failed (threshold %.0f%%)",
+                            batch_failures, len(batch), self.abort_on_failure_ratio * 100)
+                        break
+
+                    # Batch handling with longer pause. Connections stay open
+                    # across batches; the NOOP probe on checkout replaces them
+                    # lazily if the pause outlived the server's idle timeout
+                    if batch_start + batch_size < len(emails):
+                        self.logger.info("Completed batch of %d emails. Pausing for %d seconds...", len(batch), self.batch_delay)
+                        time.sleep(self.batch_delay)
+
         except KeyboardInterrupt:
             self.logger.info("Email sending interrupted by user")
         except Exception as e:
-            self.logger.error(f"Unexpected error during bulk email send: {str(e)}")
+            self.logger.error("Unexpected error during bulk email send: %s", e)
         finally:
-            # Always close the SMTP connection when done
-            self.close_smtp_connection()
-            
+            # Always close the SMTP connections when done
+            self.close_smtp_pool()
+
             # Print final statistics
             self.print_statistics()
-    
+
+    def _send_worker(self, email: str) -> bool:
+        """
+        Worker task: send one email with retry logic.
+
+        Args:
+            email (str): Recipient's email address
+
+        Returns:
+            bool: True if email was sent successfully, False otherwise
+        """
+        # Shared token bucket paces all workers at the configured average
+        # rate while still allowing short bursts up to the bucket size
+        self.rate_limiter.acquire()
+
+        # Re-check the daily limit per email: the batch-level check alone
+        # would let a full batch overshoot the cap near the boundary
+        if not self.check_daily_limit():
+            return False
+
+        return self.send_email_with_retry(email)
+
+    async def _create_async_smtp_connection(self):
+        """Create and return an authenticated aiosmtplib connection, or None."""
+        try:
+            server = aiosmtplib.SMTP(hostname=self.smtp_server, port=self.smtp_port,
+                                     start_tls=False, tls_context=self._ssl_ctx)
+            await server.connect()
+            await server.starttls(tls_context=self._ssl_ctx)
+            await server.login(self.sender_email, self.sender_password)
+            self.logger.info("Async SMTP connection established successfully")
+            return server
+        except Exception as e:
+            self.logger.error("Failed to create async SMTP connection: %s", e)
+            return None
+
+    async def send_bulk_emails_async(self, emails: List[str], test_mode: bool = True):
+        """
+        Async variant of send_bulk_emails built on aiosmtplib.
+
+        A single event loop holds all SMTP conversations in flight at once,
+        so concurrency is bounded by the connection pool size rather than
+        thread count. Requires the optional aiosmtplib dependency; without
+        it this falls back to the threaded sender. The same token bucket
+        and daily limit apply.
+
+        Args:
+            emails (List[str]): List of email addresses
+            test_mode (bool): If True, sends only to first 3 emails for testing
+        """
+        if aiosmtplib is None:
+            self.logger.warning("aiosmtplib is not installed; falling back to the threaded sender")
+            self.send_bulk_emails(emails, test_mode=test_mode)
+            return
+
+        if not emails:
+            self.logger.warning("No emails to send")
+            return
+
+        if test_mode:
+            emails = emails[:3]  # Send to first 3 emails only in test mode
+            self.logger.info("TEST MODE: Sending to first 3 emails only")
+
+        self.stats['total_emails'] = len(emails)
+        self.logger.info("Starting async bulk email send to %d recipients", len(emails))
+
+        # Pool of async connections, mirroring the threaded pool
+        pool = asyncio.Queue()
+        for _ in range(self.concurrency):
+            server = await self._create_async_smtp_connection()
+            if server is None:
+                break
+            pool.put_nowait(server)
+
+        if pool.empty():
+            self.logger.error("Could not establish initial SMTP connections. Aborting.")
+            return
+
+        semaphore = asyncio.Semaphore(pool.qsize())
+        template = self._get_payload_template()
+
+        async def send_one(email: str) -> bool:
+            async with semaphore:
+                await self.rate_limiter.acquire_async()
+
+                if not self.check_daily_limit():
+                    return False
+
+                payload = template.replace(_RECIPIENT_TOKEN.encode('ascii'),
+                                           email.encode('ascii'))
+
+                # Failed reconnects can leave the pool smaller than the
+                # semaphore, so an unbounded get() could wait forever once
+                # enough connections die; fail the send instead
+                try:
+                    server = await asyncio.wait_for(pool.get(), timeout=self.smtp_timeout)
+                except asyncio.TimeoutError:
+                    self.logger.error("Timed out waiting for an SMTP connection for %s", email)
+                    self._bump('failed_sends')
+                    return False
+
+                try:
+                    await server.sendmail(self.sender_email, email, payload)
+                except Exception as e:
+                    self.logger.error("Failed to send email to %s: %s", email, e)
+                    self._bump('failed_sends')
+
+                    # Replace the (possibly broken) connection in the pool
+                    try:
+                        await server.quit()
+                    except Exception:
+                        pass
+                    replacement = await self._create_async_smtp_connection()
+                    if replacement is not None:
+                        pool.put_nowait(replacement)
+                    return False
+                else:
+                    pool.put_nowait(server)
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info("Email sent successfully to: %s", email)
+                    with self._stats_lock:
+                        self.stats['successful_sends'] += 1
+                        self.stats['emails_sent_today'] += 1
+                    return True
+
+        try:
+            await asyncio.gather(*(send_one(email) for email in emails))
+        finally:
+            while not pool.empty():
+                server = pool.get_nowait()
+                try:
+                    await server.quit()
+                except Exception:
+                    pass
+
+            self.print_statistics()
+
     def print_statistics(self):
         """Print email sending statistics."""
         self.logger.info("="*50)
         self.logger.info("EMAIL SENDING STATISTICS")
         self.logger.info("="*50)
-        self.logger.info(f"Total emails to send: {self.stats['total_emails']}")
-        self.logger.info(f"Successfully sent: {self.stats['successful_sends']}")
-        self.logger.info(f"Failed to send: {self.stats['failed_sends']}")
-        self.logger.info(f"Invalid email formats: {self.stats['invalid_emails']}")
-        self.logger.info(f"Retry attempts: {self.stats['retries']}")
-        self.logger.info(f"Emails sent today: {self.stats['emails_sent_today']}")
-        self.logger.info(f"Daily limit remaining: {self.daily_limit - self.stats['emails_sent_today']}")
+        self.logger.info("Total emails to send: %d", self.stats['total_emails'])
+        self.logger.info("Successfully sent: %d", self.stats['successful_sends'])
+        self.logger.info("Failed to send: %d", self.stats['failed_sends'])
+        self.logger.info("Invalid email formats: %d", self.stats['invalid_emails'])
+        self.logger.info("Retry attempts: %d", self.stats['retries'])
+        self.logger.info("Emails sent today: %d", self.stats['emails_sent_today'])
+        self.logger.info("Daily limit remaining: %d", self.daily_limit - self.stats['emails_sent_today'])
         
         if self.stats['total_emails'] > 0:
             success_rate = (self.stats['successful_sends'] / self.stats['total_emails']) * 100
-            self.logger.info(f"Success rate: {success_rate:.2f}%")
+            self.logger.info("Success rate: %.2f%%", success_rate)
         
         self.logger.info("="*50)
 
@@ -576,7 +1139,7 @@ def main():
     print(f"📧 Sender: {sender.sender_name} <{sender.sender_email}>")
     print(f"🌐 SMTP Server: {sender.smtp_server}:{sender.smtp_port}")
     print(f"📊 Daily Limit: {sender.daily_limit} emails")
-    print(f"⏱️  Rate Limiting: {sender.delay_between_emails}s between emails, {sender.batch_delay}s between batches")
+    print(f"⚡ Concurrency: {sender.concurrency} parallel SMTP sessions, {sender.batch_delay}s between batches")
     print(f"🔄 Retry Logic: {sender.max_retries + 1} attempts with exponential backoff")
     print()
     